@@ -17,9 +17,8 @@ Run from repo root:
   python3 Tests/parser_coverage.py
 """
 
-import json
+import random
 import re
-import subprocess
 import sys
 from pathlib import Path
 
@@ -43,6 +42,7 @@ import testscript
 KEY_DICT_PATTERN = re.compile(r'\["([A-Za-z][A-Za-z0-9_/ -]*?)"\]')
 KEY_GET_PATTERN = re.compile(r'\.get\(\s*"([A-Za-z][A-Za-z0-9_/ -]*?)"')
 HAS_PREFIX_PATTERN = re.compile(r'hasPrefix\(\s*"([A-Za-z][A-Za-z0-9_/ -]*?):"\s*\)')
+REMARKS_SEPARATOR_PATTERN = re.compile(r"[,;]")
 
 def extract_ios_keys():
     keys_to_files = {}
@@ -111,17 +111,37 @@ SCENARIO_BUILDERS = {
 }
 
 REMARKS_BUILDERS = {
-    "cot_drone_remarks": lambda: extract_remarks(testscript.cot_drone(make_drone("wifi"))),
-    "cot_pilot_remarks": lambda: extract_remarks(testscript.cot_pilot(make_drone("wifi"))),
-    "cot_home_remarks": lambda: extract_remarks(testscript.cot_home(make_drone("wifi"))),
-    "cot_status_remarks": lambda: extract_remarks(testscript.cot_status()),
+    "cot_drone_remarks": lambda: testscript.drone_remarks(make_drone("wifi")),
+    "cot_pilot_remarks": lambda: testscript.pilot_remarks(make_drone("wifi")),
+    "cot_home_remarks": lambda: testscript.home_remarks(make_drone("wifi")),
+    "cot_status_remarks": lambda: testscript.status_remarks(),
+}
+
+# CoT builder / remarks builder pairs checked end to end: the <remarks> body of
+# each emitted event must be exactly the escaped remarks string.
+COT_REMARKS_PATTERN = re.compile(rb"<remarks>(.*?)</remarks>", re.DOTALL)
+COT_REMARKS_PAIRS = {
+    "cot_drone": (testscript.cot_drone, testscript.drone_remarks),
+    "cot_pilot": (testscript.cot_pilot, testscript.pilot_remarks),
+    "cot_home": (testscript.cot_home, testscript.home_remarks),
+    "cot_status": (lambda _d: testscript.cot_status(), lambda _d: testscript.status_remarks()),
 }
 
 
-def extract_remarks(xml_bytes):
-    text = xml_bytes.decode("utf-8")
-    m = re.search(r"<remarks>(.+?)</remarks>", text, re.DOTALL)
-    return m.group(1) if m else ""
+def check_cot_remarks():
+    """Labels of CoT events whose <remarks> body differs from
+    xml_escape(remarks_builder(d)) for the same drone and RNG state."""
+    mismatched = []
+    for label, (cot_builder, remarks_builder) in COT_REMARKS_PAIRS.items():
+        d = make_drone("wifi")
+        rng_state = random.getstate()
+        xml_bytes = cot_builder(d)
+        random.setstate(rng_state)
+        expected = testscript.xml_escape(remarks_builder(d)).encode("utf-8")
+        m = COT_REMARKS_PATTERN.search(xml_bytes)
+        if m is None or m.group(1) != expected:
+            mismatched.append(label)
+    return mismatched
 
 
 # ---------------------------------------------------------------------
@@ -213,7 +233,7 @@ def main():
         if label == "cot_drone_remarks":
             unmatched_in_remarks = [
                 seg.split(":", 1)[0].strip()
-                for seg in re.split(r"[,;]", remarks)
+                for seg in REMARKS_SEPARATOR_PATTERN.split(remarks)
                 if ":" in seg
             ]
             unrecognised = sorted({s for s in unmatched_in_remarks
@@ -238,6 +258,14 @@ def main():
         read_status = "✓" if k in ios_keys else " "
         print(f"  [{emit_status}emit/{read_status}read] {k:<32s} {','.join(files) if files else '—'}")
 
+    print("\n[5] COT REMARKS ROUND-TRIP — <remarks> in emitted XML vs remarks builders")
+    print("-" * 72)
+    mismatched = check_cot_remarks()
+    if mismatched:
+        print(f"  MISMATCH: {mismatched}")
+        sys.exit(1)
+    print(f"  all {len(COT_REMARKS_PAIRS)} CoT events carry their builder's remarks")
+
 
 if __name__ == "__main__":
     main()
@@ -63,6 +63,11 @@ try:
 except ImportError:
     MQTT_AVAILABLE = False
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # =====================================================================
 # Source-verified enum tables
@@ -95,7 +100,16 @@ AUTH_TYPES = [
     "Private Use", "MFG Spec",
 ]
 ACCURACY_STRINGS = ["<1m", "<3m", "<10m", "<30m", "<100m", "Unknown"]
+TIMESTAMP_ACCURACY_STRINGS = ["0.1s", "0.2s", "0.5s", "1.0s"]
+EW_DIR_SEGMENTS = ["E", "W"]
+SPEED_MULTIPLIERS = ["0.25", "0.75"]
 PROTOCOL_VERSIONS = ["F3411.19", "F3411.22a"]
+BLE_PHYS = [1, 2, 3]
+BLE_ADV_MODES = ["Connectable", "Non-Connectable", "Scannable"]
+SIM_UA_NAMES = ["Aeroplane", "Helicopter", "Hybrid Lift", "Other"]
+FREQUENCY_MHZ_BY_TRANSPORT = {"wifi": 2412.0, "ble": 2402.0, "uart": 0.0, "dji": 5765.0}
+
+METERS_PER_DEG_LAT = 111000.0
 
 
 # =====================================================================
@@ -113,11 +127,13 @@ class Config:
     mqtt_port: int = 1883
     mqtt_topic: str = "wardragon/drone"
     rate_hz: float = 1.0
+    burst: int = 1
     health_rate_hz: float = 0.1
     status_rate_hz: float = 0.033
     scenarios: list = field(default_factory=lambda: ["wifi"])
     duration_s: float = 0.0
     seed: int = 0
+    log_every: int = 1
     lat_center: float = 37.25
     lon_center: float = -115.75
 
@@ -127,8 +143,19 @@ class Config:
 # =====================================================================
 
 class DroneSim:
+    __slots__ = (
+        "id", "uid_base", "id_type", "caa_id", "mac", "ua_type_name", "ua_type",
+        "transport", "cfg", "heading", "speed", "altitude", "height_agl",
+        "lat", "lon", "home_lat", "home_lon", "operator_lat", "operator_lon",
+        "index", "runtime", "first_seen", "frequency_mhz", "protocol_version",
+        "rssi_baseline", "rssi", "operator_id_value", "operator_id_type_value",
+        "operator_display",
+    )
+
     def __init__(self, drone_id, mac, ua_name, transport, cfg, id_type=None, caa_id=None):
         self.id = drone_id
+        # DragonSync keys pilot-/home- events on the id without its drone- prefix.
+        self.uid_base = drone_id[len("drone-"):] if drone_id.startswith("drone-") else drone_id
         self.id_type = id_type or ID_TYPES[0]
         self.caa_id = caa_id
         self.mac = mac
@@ -149,20 +176,22 @@ class DroneSim:
         self.index = random.randint(1, 200)
         self.runtime = random.randint(60, 1800)
         self.first_seen = time.time()
-        self.frequency_mhz = {"wifi": 2412.0, "ble": 2402.0, "uart": 0.0, "dji": 5765.0}.get(transport, 0.0)
+        self.frequency_mhz = FREQUENCY_MHZ_BY_TRANSPORT.get(transport, 0.0)
         self.protocol_version = random.choice(PROTOCOL_VERSIONS)
         self.rssi_baseline = random.randint(-78, -45)
         self.rssi = self.rssi_baseline
         self.operator_id_value = f"FAA{random.randint(1000, 9999)}-{random.randint(100,999)}"
         self.operator_id_type_value = random.choice(OPERATOR_ID_TYPES)
+        self.operator_display = f"[{self.operator_id_type_value}: {self.operator_id_value}]"
 
     def step(self, dt):
         self.heading = (self.heading + random.uniform(-8, 8)) % 360
         self.speed = max(0.0, self.speed + random.uniform(-1.5, 1.5))
         rad = math.radians(self.heading)
-        d_lat = (self.speed * dt * math.cos(rad)) / 111000.0
+        dist = self.speed * dt
+        d_lat = (dist * math.cos(rad)) / METERS_PER_DEG_LAT
         cos_lat = max(0.01, math.cos(math.radians(self.lat)))
-        d_lon = (self.speed * dt * math.sin(rad)) / (111000.0 * cos_lat)
+        d_lon = (dist * math.sin(rad)) / (METERS_PER_DEG_LAT * cos_lat)
         self.lat += d_lat
         self.lon += d_lon
         self.altitude = max(0.0, self.altitude + random.uniform(-2, 2))
@@ -172,16 +201,28 @@ class DroneSim:
         self.rssi = max(-110, min(-20, self.rssi_baseline + random.randint(-3, 3)))
 
 
-def now_iso():
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+def iso_utc(ns):
+    """Epoch nanoseconds as CoT's %Y-%m-%dT%H:%M:%S.%fZ, without a datetime object."""
+    sec, frac = divmod(ns, 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec))}.{frac // 1000:06d}Z"
 
 
-def stale_iso(seconds=600):
-    return (datetime.now(timezone.utc) + timedelta(seconds=seconds)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+def cot_times(stale_seconds=600):
+    """(time, stale) strings read from a single clock sample. The cot_* builders
+    accept the pair via times= so one tick's events share a timestamp."""
+    ns = time.time_ns()
+    return iso_utc(ns), iso_utc(ns + stale_seconds * 1_000_000_000)
+
+
+def encode_json(payload):
+    """Compact wire encoding. orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 
 def random_mac():
-    return ":".join(f"{random.randint(0, 255):02X}" for _ in range(6))
+    return random.getrandbits(48).to_bytes(6, "big").hex(":").upper()
 
 
 def random_aa():
@@ -218,8 +259,8 @@ def build_location(d, include_canonical_accuracy=True):
         "height_agl": round(d.height_agl, 1),
         "height_type": random.choice(HEIGHT_TYPES),
         "pressure_altitude": round(d.altitude + random.uniform(-3, 3), 1),
-        "ew_dir_segment": random.choice(["E", "W"]),
-        "speed_multiplier": random.choice(["0.25", "0.75"]),
+        "ew_dir_segment": random.choice(EW_DIR_SEGMENTS),
+        "speed_multiplier": random.choice(SPEED_MULTIPLIERS),
         "op_status": random.choice(OP_STATUS),
         "direction": int(d.heading),
         "timestamp": int(time.time()),
@@ -228,22 +269,25 @@ def build_location(d, include_canonical_accuracy=True):
         "protocol_version": d.protocol_version,
     }
     if include_canonical_accuracy:
+        h_acc, v_acc, baro_acc, speed_acc = random.choices(ACCURACY_STRINGS, k=4)
         loc.update({
-            "horizontal_accuracy": random.choice(ACCURACY_STRINGS),
-            "vertical_accuracy": random.choice(ACCURACY_STRINGS),
-            "baro_accuracy": random.choice(ACCURACY_STRINGS),
-            "speed_accuracy": random.choice(ACCURACY_STRINGS),
-            "timestamp_accuracy": random.choice(["0.1s", "0.2s", "0.5s", "1.0s"]),
+            "horizontal_accuracy": h_acc,
+            "vertical_accuracy": v_acc,
+            "baro_accuracy": baro_acc,
+            "speed_accuracy": speed_acc,
+            "timestamp_accuracy": random.choice(TIMESTAMP_ACCURACY_STRINGS),
         })
     return loc
 
 
 def build_system(d, include_area=False):
+    operator_lat = round(d.operator_lat, 7)
+    operator_lon = round(d.operator_lon, 7)
     sys_msg = {
-        "latitude": round(d.operator_lat, 7),
-        "longitude": round(d.operator_lon, 7),
-        "operator_lat": round(d.operator_lat, 7),
-        "operator_lon": round(d.operator_lon, 7),
+        "latitude": operator_lat,
+        "longitude": operator_lon,
+        "operator_lat": operator_lat,
+        "operator_lon": operator_lon,
         "home_lat": round(d.home_lat, 7),
         "home_lon": round(d.home_lon, 7),
         "operator_altitude_geo": round(d.altitude - 5.0, 1),
@@ -278,7 +322,8 @@ def build_operator_id(d):
 
 
 def build_auth_page(page_index, page_count, _d):
-    payload = "".join(random.choices("0123456789ABCDEF", k=46 if page_index > 0 else 34))
+    n = 23 if page_index > 0 else 17
+    payload = f"{random.getrandbits(8 * n):0{2 * n}X}"
     return {
         "auth_type": random.choice(AUTH_TYPES),
         "auth_data": payload,
@@ -293,7 +338,7 @@ def build_aux_adv_ind(d):
     return {
         "aa": random_aa(),
         "chan": 37 + random.randint(0, 2),
-        "phy": random.choice([1, 2, 3]),
+        "phy": random.choice(BLE_PHYS),
         "rssi": d.rssi,
         "addr": d.mac,
     }
@@ -302,13 +347,13 @@ def build_aux_adv_ind(d):
 def build_aext(d):
     return {
         "AdvA": f"{d.mac} (random)",
-        "AdvData": "".join(random.choices("0123456789abcdef", k=64)),
+        "AdvData": f"{random.getrandbits(256):064x}",
         "AdvDataInfo": {
             "did": random.randint(0, 4095),
             "sid": random.randint(0, 15),
             "mac": d.mac,
         },
-        "AdvMode": random.choice(["Connectable", "Non-Connectable", "Scannable"]),
+        "AdvMode": random.choice(BLE_ADV_MODES),
     }
 
 
@@ -445,6 +490,7 @@ def scenario_legacy(d):
     """Legacy zmq_decoder.py output shape: short-form accuracy keys, classification
     Int (not classification_type), operator_alt_geo (not operator_altitude_geo),
     no transport, no frequency_mhz. Verifies iOS backward-compat reads."""
+    now = int(time.time())
     obj = {
         "Basic ID": {
             "id": d.id,
@@ -471,7 +517,7 @@ def scenario_legacy(d):
             "vert_acc": "<3m",
             "baro_acc": random.randint(0, 7),
             "speed_acc": random.randint(0, 4),
-            "timestamp": int(time.time()),
+            "timestamp": now,
             "status": 0,
             "alt_pressure": round(d.altitude, 1),
             "operator_alt_geo": round(d.altitude - 5.0, 1),
@@ -482,7 +528,7 @@ def scenario_legacy(d):
             "home_lat": round(d.home_lat, 7),
             "home_lon": round(d.home_lon, 7),
             "classification": random.randint(0, 7),
-            "timestamp": int(time.time()),
+            "timestamp": now,
         },
         "Self-ID Message": {
             "text": f"UAV {d.mac.lower()} operational",
@@ -512,21 +558,24 @@ def scenario_multi(drones):
 
 
 def scenario_health(uptime_s):
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
+    connected_since = (now - timedelta(seconds=uptime_s)).isoformat()
     sources = {}
     for src in ("wifi", "ble", "uart", "dji"):
         sources[src] = {
             "enabled": True,
             "state": "connected",
             "state_str": "running",
-            "connected_since": (datetime.now(timezone.utc) - timedelta(seconds=uptime_s)).isoformat(),
-            "last_message_time": datetime.now(timezone.utc).isoformat(),
+            "connected_since": connected_since,
+            "last_message_time": now_iso,
             "connect_attempts": 1,
             "messages_total": random.randint(100, 100000),
             "messages_per_sec": round(random.uniform(0.5, 12.0), 2),
             "errors_total": random.randint(0, 50),
             "errors_recent": random.randint(0, 3),
             "last_error": "" if random.random() > 0.2 else "i/o timeout",
-            "last_error_time": datetime.now(timezone.utc).isoformat(),
+            "last_error_time": now_iso,
             "uptime": uptime_s,
             "uptime_ns": uptime_s * 1_000_000_000,
         }
@@ -534,8 +583,8 @@ def scenario_health(uptime_s):
         "enabled": True,
         "state": "running",
         "state_str": "running",
-        "connected_since": (datetime.now(timezone.utc) - timedelta(seconds=uptime_s)).isoformat(),
-        "last_message_time": datetime.now(timezone.utc).isoformat(),
+        "connected_since": connected_since,
+        "last_message_time": now_iso,
         "connect_attempts": 1,
         "messages_total": sum(s["messages_total"] for s in sources.values()),
         "messages_per_sec": round(sum(s["messages_per_sec"] for s in sources.values()), 2),
@@ -616,7 +665,58 @@ def apply_spoof(obj, kind):
 # DragonSync CoT XML emitters (multicast 239.2.3.1:6969)
 # =====================================================================
 
-def cot_drone(d):
+DRONE_COT_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<event version="2.0" uid="drone-{uid}" type="a-u-A-M-H-R" '
+    'time="{time}" start="{time}" stale="{stale}" how="m-g">'
+    '<point lat="{lat:.7f}" lon="{lon:.7f}" hae="{alt:.1f}" ce="35.0" le="999999"/>'
+    '<detail>'
+    '<contact callsign="drone-{uid}"/>'
+    '<precisionlocation geopointsrc="gps" altsrc="gps"/>'
+    '<track course="{course:.1f}" speed="{speed:.2f}"/>'
+    '<remarks>{remarks}</remarks>'
+    '<color argb="-256"/>'
+    '</detail></event>'
+)
+
+PERSON_COT_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<event version="2.0" uid="{uid}" type="b-m-p-s-m" '
+    'time="{time}" start="{time}" stale="{stale}" how="m-g">'
+    '<point lat="{lat:.7f}" lon="{lon:.7f}" hae="{alt:.1f}" ce="35.0" le="999999"/>'
+    '<detail>'
+    '<contact callsign="{uid}"/>'
+    '<precisionlocation geopointsrc="gps" altsrc="gps"/>'
+    '<usericon iconsetpath="com.atakmap.android.maps.public/Civilian/{icon}.png"/>'
+    '<remarks>{remarks}</remarks>'
+    '</detail></event>'
+)
+
+ADSB_COT_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<event version="2.0" uid="{uid}" type="a-f-A" '
+    'time="{time}" start="{time}" stale="{stale}" how="m-g">'
+    '<point lat="{lat:.6f}" lon="{lon:.6f}" hae="{hae:.1f}" ce="35.0" le="999999"/>'
+    '<detail>'
+    '<contact callsign="{callsign}"/>'
+    '<track course="{course}" speed="{speed}"/>'
+    '<remarks>{remarks}</remarks>'
+    '</detail></event>'
+)
+
+STATUS_COT_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<event version="2.0" uid="{uid}" type="b-m-p-s-m">'
+    '<point lat="37.7749" lon="-122.4194" hae="30.0" ce="9999999" le="9999999"/>'
+    '<detail>'
+    '<track course="0.0" speed="0.0"/>'
+    '<status readiness="true"/>'
+    '<remarks>{remarks}</remarks>'
+    '</detail></event>'
+)
+
+
+def drone_remarks(d):
     """Drone CoT remarks. Combines DragonSync build_drone_cot fields (MAC, RSSI,
     ID Type, UA Type, Operator ID, Speed, Altitude, Course, Index, Runtime,
     Description, Transport, Freq) with the inline System: [...] block that
@@ -625,11 +725,10 @@ def cot_drone(d):
     pilot-/home- CoT events, which iOS filters out — embedding them inline lets
     iOS surface operator and home location from a single multicast event."""
     ua_name = d.ua_type_name
-    op_display = f"[{d.operator_id_type_value}: {d.operator_id_value}]"
     remarks = (
         f"MAC: {d.mac}, RSSI: {d.rssi}dBm; "
         f"ID Type: {d.id_type}; UA Type: {ua_name} ({d.ua_type}); "
-        f"Operator ID: {op_display}; "
+        f"Operator ID: {d.operator_display}; "
         f"Speed: {d.speed:.2f} m/s; Vert Speed: 0.0 m/s; "
         f"Altitude: {d.altitude:.1f} m; AGL: {d.height_agl:.1f} m; "
         f"Course: {d.heading:.1f}°; "
@@ -647,58 +746,49 @@ def cot_drone(d):
         f"Home Lat: {d.home_lat:.7f}, "
         f"Home Lon: {d.home_lon:.7f}]"
     )
-    return (
-        f'<?xml version="1.0" encoding="UTF-8"?>'
-        f'<event version="2.0" uid="drone-{d.id}" type="a-u-A-M-H-R" '
-        f'time="{now_iso()}" start="{now_iso()}" stale="{stale_iso()}" how="m-g">'
-        f'<point lat="{d.lat:.7f}" lon="{d.lon:.7f}" hae="{d.altitude:.1f}" ce="35.0" le="999999"/>'
-        f'<detail>'
-        f'<contact callsign="drone-{d.id}"/>'
-        f'<precisionlocation geopointsrc="gps" altsrc="gps"/>'
-        f'<track course="{d.heading:.1f}" speed="{d.speed:.2f}"/>'
-        f'<remarks>{xml_escape(remarks)}</remarks>'
-        f'<color argb="-256"/>'
-        f'</detail></event>'
+    return remarks
+
+
+def pilot_remarks(d):
+    return f"Pilot location for drone drone-{d.id}"
+
+
+def home_remarks(d):
+    return f"Home location for drone drone-{d.id}"
+
+
+def cot_drone(d, times=None):
+    """Mirrors DragonSync build_drone_cot, with remarks from drone_remarks()."""
+    now_str, stale_str = times or cot_times()
+    return DRONE_COT_TEMPLATE.format(
+        uid=d.id, time=now_str, stale=stale_str,
+        lat=d.lat, lon=d.lon, alt=d.altitude,
+        course=d.heading, speed=d.speed,
+        remarks=xml_escape(drone_remarks(d)),
     ).encode("utf-8")
 
 
-def cot_pilot(d):
+def cot_pilot(d, times=None):
     """Mirrors DragonSync build_pilot_cot. iOS XMLParserDelegate filters on uid prefix 'pilot-'."""
-    base = d.id[len("drone-"):] if d.id.startswith("drone-") else d.id
-    remarks = f"Pilot location for drone drone-{d.id}"
-    return (
-        f'<?xml version="1.0" encoding="UTF-8"?>'
-        f'<event version="2.0" uid="pilot-{base}" type="b-m-p-s-m" '
-        f'time="{now_iso()}" start="{now_iso()}" stale="{stale_iso()}" how="m-g">'
-        f'<point lat="{d.operator_lat:.7f}" lon="{d.operator_lon:.7f}" hae="{d.altitude:.1f}" ce="35.0" le="999999"/>'
-        f'<detail>'
-        f'<contact callsign="pilot-{base}"/>'
-        f'<precisionlocation geopointsrc="gps" altsrc="gps"/>'
-        f'<usericon iconsetpath="com.atakmap.android.maps.public/Civilian/Person.png"/>'
-        f'<remarks>{xml_escape(remarks)}</remarks>'
-        f'</detail></event>'
+    now_str, stale_str = times or cot_times()
+    return PERSON_COT_TEMPLATE.format(
+        uid=f"pilot-{d.uid_base}", time=now_str, stale=stale_str,
+        lat=d.operator_lat, lon=d.operator_lon, alt=d.altitude,
+        icon="Person", remarks=xml_escape(pilot_remarks(d)),
     ).encode("utf-8")
 
 
-def cot_home(d):
+def cot_home(d, times=None):
     """Mirrors DragonSync build_home_cot. iOS filters on uid prefix 'home-'."""
-    base = d.id[len("drone-"):] if d.id.startswith("drone-") else d.id
-    remarks = f"Home location for drone drone-{d.id}"
-    return (
-        f'<?xml version="1.0" encoding="UTF-8"?>'
-        f'<event version="2.0" uid="home-{base}" type="b-m-p-s-m" '
-        f'time="{now_iso()}" start="{now_iso()}" stale="{stale_iso()}" how="m-g">'
-        f'<point lat="{d.home_lat:.7f}" lon="{d.home_lon:.7f}" hae="{d.altitude:.1f}" ce="35.0" le="999999"/>'
-        f'<detail>'
-        f'<contact callsign="home-{base}"/>'
-        f'<precisionlocation geopointsrc="gps" altsrc="gps"/>'
-        f'<usericon iconsetpath="com.atakmap.android.maps.public/Civilian/House.png"/>'
-        f'<remarks>{xml_escape(remarks)}</remarks>'
-        f'</detail></event>'
+    now_str, stale_str = times or cot_times()
+    return PERSON_COT_TEMPLATE.format(
+        uid=f"home-{d.uid_base}", time=now_str, stale=stale_str,
+        lat=d.home_lat, lon=d.home_lon, alt=d.altitude,
+        icon="House", remarks=xml_escape(home_remarks(d)),
     ).encode("utf-8")
 
 
-def cot_adsb(craft):
+def cot_adsb(craft, times=None):
     """Mirrors DragonSync build_adsb_cot. ADS-B aircraft uid uses ICAO hex."""
     uid = f"ADSB-{craft['hex']}"
     callsign = craft.get("flight", uid)
@@ -706,21 +796,17 @@ def cot_adsb(craft):
         f"ICAO: {craft['hex']}; Flight: {callsign}; "
         f"Altitude: {craft['alt_baro']} ft; Speed: {craft['gs']} kt; Track: {craft['track']}°"
     )
-    return (
-        f'<?xml version="1.0" encoding="UTF-8"?>'
-        f'<event version="2.0" uid="{uid}" type="a-f-A" '
-        f'time="{now_iso()}" start="{now_iso()}" stale="{stale_iso()}" how="m-g">'
-        f'<point lat="{craft["lat"]:.6f}" lon="{craft["lon"]:.6f}" hae="{craft["alt_baro"] * 0.3048:.1f}" ce="35.0" le="999999"/>'
-        f'<detail>'
-        f'<contact callsign="{callsign}"/>'
-        f'<track course="{craft["track"]}" speed="{craft["gs"]}"/>'
-        f'<remarks>{xml_escape(remarks)}</remarks>'
-        f'</detail></event>'
+    now_str, stale_str = times or cot_times()
+    return ADSB_COT_TEMPLATE.format(
+        uid=uid, time=now_str, stale=stale_str,
+        lat=craft["lat"], lon=craft["lon"], hae=craft["alt_baro"] * 0.3048,
+        callsign=callsign, course=craft["track"], speed=craft["gs"],
+        remarks=xml_escape(remarks),
     ).encode("utf-8")
 
 
-def cot_status(serial="wardragon-test-0001"):
-    """WarDragon monitor system status as CoT (matches wardragon_monitor.py output)."""
+def status_remarks():
+    """wardragon_monitor.py system-stats remarks with fresh readings."""
     cpu = round(random.uniform(5, 75), 1)
     temp = round(random.uniform(40, 70), 1)
     pluto = round(random.uniform(40, 75), 1)
@@ -746,24 +832,35 @@ def cot_status(serial="wardragon-test-0001"):
         f"Temperature: {temp}°C, Uptime: {int(time.time() % 1_000_000)} seconds, "
         f"Pluto Temp: {pluto}°C, Zynq Temp: {zynq}°C"
     )
-    return (
-        f'<?xml version="1.0" encoding="UTF-8"?>'
-        f'<event version="2.0" uid="{serial}" type="b-m-p-s-m">'
-        f'<point lat="37.7749" lon="-122.4194" hae="30.0" ce="9999999" le="9999999"/>'
-        f'<detail>'
-        f'<track course="0.0" speed="0.0"/>'
-        f'<status readiness="true"/>'
-        f'<remarks>{xml_escape(remarks)}</remarks>'
-        f'</detail></event>'
-    ).encode("utf-8")
+    return remarks
+
+
+def cot_status(serial="wardragon-test-0001"):
+    """WarDragon monitor system status as CoT (matches wardragon_monitor.py output)."""
+    return STATUS_COT_TEMPLATE.format(uid=serial, remarks=xml_escape(status_remarks())).encode("utf-8")
 
 
 # =====================================================================
 # DragonSync to_dict() shape (MQTT / Lattice / API export wire format)
 # =====================================================================
 
+# FAA RID enrichment block as DragonSync reports it before any lookup has run.
+# Template only: mqtt_dict copies it so payloads never share a mutable dict.
+MQTT_RID_NOT_LOOKED_UP = {
+    "tracking": None,
+    "status": None,
+    "make": None,
+    "model": None,
+    "source": None,
+    "lookup_attempted": False,
+    "lookup_success": False,
+}
+
+
 def mqtt_dict(d):
     """Mirrors DragonSync core/drone.py Drone.to_dict()."""
+    now = time.time()
+    v_acc, h_acc, baro_acc, speed_acc = random.choices(ACCURACY_STRINGS, k=4)
     return {
         "id": f"drone-{d.id}",
         "id_type": d.id_type,
@@ -773,18 +870,18 @@ def mqtt_dict(d):
         "operator_id": d.operator_id_value,
         "op_status": random.choice(OP_STATUS),
         "height_type": random.choice(HEIGHT_TYPES),
-        "ew_dir": random.choice(["E", "W"]),
+        "ew_dir": random.choice(EW_DIR_SEGMENTS),
         "direction": int(d.heading),
-        "speed_multiplier": random.choice(["0.25", "0.75"]),
+        "speed_multiplier": random.choice(SPEED_MULTIPLIERS),
         "pressure_altitude": round(d.altitude + random.uniform(-3, 3), 1),
-        "vertical_accuracy": random.choice(ACCURACY_STRINGS),
-        "horizontal_accuracy": random.choice(ACCURACY_STRINGS),
-        "baro_accuracy": random.choice(ACCURACY_STRINGS),
-        "speed_accuracy": random.choice(ACCURACY_STRINGS),
-        "timestamp": int(time.time()),
-        "rid_timestamp": int(time.time()),
-        "observed_at": time.time(),
-        "timestamp_accuracy": random.choice(["0.1s", "0.2s", "0.5s", "1.0s"]),
+        "vertical_accuracy": v_acc,
+        "horizontal_accuracy": h_acc,
+        "baro_accuracy": baro_acc,
+        "speed_accuracy": speed_acc,
+        "timestamp": int(now),
+        "rid_timestamp": int(now),
+        "observed_at": now,
+        "timestamp_accuracy": random.choice(TIMESTAMP_ACCURACY_STRINGS),
         "seen_by": "wardragon-test-0001",
         "lat": round(d.lat, 7),
         "lon": round(d.lon, 7),
@@ -804,16 +901,8 @@ def mqtt_dict(d):
         "caa_id": d.caa_id or "",
         "freq": d.frequency_mhz if d.frequency_mhz > 0 else None,
         "transport": d.transport,
-        "rid": {
-            "tracking": None,
-            "status": None,
-            "make": None,
-            "model": None,
-            "source": None,
-            "lookup_attempted": False,
-            "lookup_success": False,
-        },
-        "last_update_time": time.time(),
+        "rid": dict(MQTT_RID_NOT_LOOKED_UP),
+        "last_update_time": now,
         "track_type": "drone",
     }
 
@@ -823,20 +912,24 @@ def mqtt_dict(d):
 # =====================================================================
 
 class ADSBAircraft:
+    __slots__ = ("hex", "flight", "lat", "lon", "alt_baro", "gs", "gs_ms", "track")
+
     def __init__(self, cfg):
-        self.hex = "".join(random.choices("0123456789ABCDEF", k=6))
+        self.hex = f"{random.getrandbits(24):06X}"
         self.flight = f"TEST{random.randint(100, 999)}"
         self.lat = cfg.lat_center + random.uniform(-0.1, 0.1)
         self.lon = cfg.lon_center + random.uniform(-0.1, 0.1)
         self.alt_baro = random.randint(2000, 38000)
         self.gs = random.randint(120, 480)
+        self.gs_ms = self.gs * 0.514444
         self.track = random.uniform(0, 360)
 
     def step(self, dt):
         rad = math.radians(self.track)
-        d_lat = (self.gs * 0.514444 * dt * math.cos(rad)) / 111000.0
+        dist = self.gs_ms * dt
+        d_lat = (dist * math.cos(rad)) / METERS_PER_DEG_LAT
         cos_lat = max(0.01, math.cos(math.radians(self.lat)))
-        d_lon = (self.gs * 0.514444 * dt * math.sin(rad)) / (111000.0 * cos_lat)
+        d_lon = (dist * math.sin(rad)) / (METERS_PER_DEG_LAT * cos_lat)
         self.lat += d_lat
         self.lon += d_lon
         self.track = (self.track + random.uniform(-2, 2)) % 360
@@ -857,13 +950,18 @@ class ADSBAircraft:
 class Publisher:
     def __init__(self, cfg):
         self.cfg = cfg
+        self.tx_count = 0
+        self.log_every = cfg.log_every
         self.ctx = zmq.Context()
-        self.zmq_sock = self.ctx.socket(zmq.PUB)
-        self.zmq_sock.bind(f"tcp://{cfg.zmq_bind}")
-        self.status_sock = self.ctx.socket(zmq.PUB)
-        self.status_sock.bind(f"tcp://{cfg.status_bind}")
+        self.zmq_sock = self.pub_socket(cfg.zmq_bind)
+        self.status_sock = self.pub_socket(cfg.status_bind)
         self.mc_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
         self.mc_sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
+        # Large send buffer absorbs --burst spikes; non-blocking so a full
+        # buffer drops (and counts) a CoT event instead of stalling the tick.
+        self.mc_sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+        self.mc_sock.setblocking(False)
+        self.cot_dropped = 0
         if cfg.multicast_iface:
             try:
                 self.mc_sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF,
@@ -871,7 +969,19 @@ class Publisher:
                 print(f"[mc]  egress iface forced to {cfg.multicast_iface}")
             except OSError as exc:
                 print(f"[mc]  IP_MULTICAST_IF bind failed: {exc}", file=sys.stderr)
+        # Fixed destination: connect once so each send skips the address tuple.
+        # Hosts with no route to the group (e.g. a hotspot without a default
+        # route) refuse the connect; keep running and sendto the cached tuple.
+        self.mc_dest = (cfg.multicast_group, cfg.multicast_port)
+        self.mc_connected = False
+        try:
+            self.mc_sock.connect(self.mc_dest)
+            self.mc_connected = True
+        except OSError as exc:
+            print(f"[mc]  connect failed ({exc}); falling back to sendto", file=sys.stderr)
         self.mqtt_client = None
+        self.mqtt_last_info = None
+        self.mqtt_topic_prefix = f"{cfg.mqtt_topic}/"
         if cfg.mqtt_broker:
             if not MQTT_AVAILABLE:
                 print("[mqtt] paho-mqtt not installed; mqtt_dict scenario disabled", file=sys.stderr)
@@ -889,46 +999,93 @@ class Publisher:
         print(f"[zmq] status   on tcp://{cfg.status_bind}")
         print(f"[mc]  CoT      on {cfg.multicast_group}:{cfg.multicast_port}")
 
-    def send_telemetry(self, payload, label):
-        data = json.dumps(payload).encode("utf-8")
-        self.zmq_sock.send(data)
+    @staticmethod
+    def telemetry_tag(payload):
         if isinstance(payload, list):
             ids = [el["Basic ID"]["id"] for el in payload
                    if isinstance(el.get("Basic ID"), dict) and el["Basic ID"].get("id")]
-            tag = ",".join(sorted(set(ids))) or "<no-bid>"
-        else:
-            tag = (payload.get("Basic ID") or {}).get("id", "<no-bid>")
-        print(f"[tx] {label:<10} {tag} ({len(data)}B)")
+            return ",".join(sorted(set(ids))) or "<no-bid>"
+        return (payload.get("Basic ID") or {}).get("id", "<no-bid>")
+
+    def pub_socket(self, bind):
+        sock = self.ctx.socket(zmq.PUB)
+        # Deep send queue so high --rate runs queue instead of dropping
+        # at the default HWM of 1000; LINGER 0 so shutdown never waits on it.
+        sock.setsockopt(zmq.SNDHWM, 100_000)
+        sock.setsockopt(zmq.LINGER, 0)
+        sock.bind(f"tcp://{bind}")
+        return sock
+
+    def should_log(self):
+        """Count a send; True when its [tx] line should be printed (--log-every)."""
+        self.tx_count += 1
+        return self.log_every <= 1 or self.tx_count % self.log_every == 0
+
+    def send_telemetry(self, payload, label):
+        data = encode_json(payload)
+        self.zmq_sock.send(data)
+        if self.should_log():
+            print(f"[tx] {label:<10} {self.telemetry_tag(payload)} ({len(data)}B)")
+
+    def send_telemetry_batch(self, payloads, label):
+        """Publish several frames in one multipart send. ZMQHandler recv()s each
+        frame separately, so every frame must be a complete JSON document."""
+        frames = [encode_json(p) for p in payloads]
+        self.zmq_sock.send_multipart(frames)
+        for payload, data in zip(payloads, frames):
+            if self.should_log():
+                print(f"[tx] {label:<10} {self.telemetry_tag(payload)} ({len(data)}B)")
 
     def send_status_json(self, payload):
-        data = json.dumps(payload).encode("utf-8")
+        data = encode_json(payload)
         self.status_sock.send(data)
-        print(f"[tx] status_js ({len(data)}B)")
+        if self.should_log():
+            print(f"[tx] status_js ({len(data)}B)")
 
     def send_health(self, payload):
-        data = json.dumps(payload).encode("utf-8")
+        data = encode_json(payload)
         self.zmq_sock.send(data)
-        print(f"[tx] health     sources={len(payload.get('sources', {}))} ({len(data)}B)")
+        if self.should_log():
+            print(f"[tx] health     sources={len(payload.get('sources', {}))} ({len(data)}B)")
 
     def send_cot(self, xml_bytes, label):
-        self.mc_sock.sendto(xml_bytes, (self.cfg.multicast_group, self.cfg.multicast_port))
-        print(f"[tx] {label:<10} cot multicast ({len(xml_bytes)}B)")
+        try:
+            if self.mc_connected:
+                self.mc_sock.send(xml_bytes)
+            else:
+                self.mc_sock.sendto(xml_bytes, self.mc_dest)
+        except BlockingIOError:
+            self.cot_dropped += 1
+            return
+        if self.should_log():
+            print(f"[tx] {label:<10} cot multicast ({len(xml_bytes)}B)")
 
     def send_mqtt(self, payload, sub_topic=""):
         if not self.mqtt_client:
             return
-        topic = f"{self.cfg.mqtt_topic}/{sub_topic}" if sub_topic else self.cfg.mqtt_topic
-        self.mqtt_client.publish(topic, json.dumps(payload), qos=0)
-        print(f"[tx] mqtt_dict topic={topic} ({len(json.dumps(payload))}B)")
+        topic = self.mqtt_topic_prefix + sub_topic if sub_topic else self.cfg.mqtt_topic
+        data = encode_json(payload)
+        self.mqtt_last_info = self.mqtt_client.publish(topic, data, qos=0)
+        if self.should_log():
+            print(f"[tx] mqtt_dict topic={topic} ({len(data)}B)")
 
     def close(self):
-        self.zmq_sock.close(linger=0)
-        self.status_sock.close(linger=0)
+        self.zmq_sock.close()
+        self.status_sock.close()
         self.ctx.term()
         self.mc_sock.close()
+        if self.cot_dropped:
+            print(f"[mc]  {self.cot_dropped} CoT events dropped (send buffer full)", file=sys.stderr)
         if self.mqtt_client:
-            self.mqtt_client.loop_stop()
+            # Publishes are fire-and-forget; only flush the tail before the
+            # network loop goes away, then disconnect while it can still send.
+            if self.mqtt_last_info is not None:
+                try:
+                    self.mqtt_last_info.wait_for_publish(timeout=2.0)
+                except (RuntimeError, ValueError) as exc:
+                    print(f"[mqtt] final publish not flushed: {exc}", file=sys.stderr)
             self.mqtt_client.disconnect()
+            self.mqtt_client.loop_stop()
 
 
 # =====================================================================
@@ -945,10 +1102,41 @@ ALL_SCENARIOS = [
 
 def make_drone(transport, cfg, ua=None):
     serial = uuid.uuid4().hex[:20].upper()
-    ua_name = ua or random.choice(["Aeroplane", "Helicopter", "Hybrid Lift", "Other"])
+    ua_name = ua or random.choice(SIM_UA_NAMES)
     return DroneSim(serial, random_mac(), ua_name, transport, cfg)
 
 
+def scenario_table(pub, drones, multi_drones, aircraft):
+    """Per-tick emitter for each scenario name, called with the tick's CoT
+    (time, stale) pair. health/status are periodic and handled by run()."""
+    wifi = drones["wifi"]
+    table = {
+        "wifi": lambda ts: pub.send_telemetry(scenario_wifi(wifi), "wifi"),
+        "ble": lambda ts: pub.send_telemetry(scenario_ble(drones["ble"]), "ble"),
+        "uart": lambda ts: pub.send_telemetry(scenario_uart(drones["uart"]), "uart"),
+        "dji": lambda ts: pub.send_telemetry(scenario_dji(drones["dji"]), "dji"),
+        "area": lambda ts: pub.send_telemetry(scenario_area(wifi), "area"),
+        "auth": lambda ts: pub.send_telemetry_batch(scenario_auth(wifi), "auth"),
+        "caa": lambda ts: pub.send_telemetry(scenario_caa(wifi), "caa"),
+        "utm": lambda ts: pub.send_telemetry(scenario_utm(wifi), "utm"),
+        "session": lambda ts: pub.send_telemetry(scenario_session(wifi), "session"),
+        "multi": lambda ts: pub.send_telemetry(scenario_multi(multi_drones), "multi"),
+        "fpv": lambda ts: pub.send_telemetry(scenario_fpv(wifi), "fpv"),
+        "fpv_serial": lambda ts: pub.send_telemetry(scenario_fpv_serial(wifi), "fpv_serial"),
+        "legacy": lambda ts: pub.send_telemetry(scenario_legacy(wifi), "legacy"),
+        "cot": lambda ts: pub.send_cot(cot_drone(wifi, ts), "cot_drone"),
+        "pilot": lambda ts: pub.send_cot(cot_pilot(wifi, ts), "cot_pilot"),
+        "home": lambda ts: pub.send_cot(cot_home(wifi, ts), "cot_home"),
+        "adsb": lambda ts: pub.send_cot(cot_adsb(aircraft.as_dict(), ts), "cot_adsb"),
+        "status_cot": lambda ts: pub.send_cot(cot_status(), "status_cot"),
+        "mqtt_dict": lambda ts: pub.send_mqtt(mqtt_dict(wifi), sub_topic=f"drone-{wifi.id}"),
+    }
+    for kind in SPOOF_KINDS:
+        table[f"spoof:{kind}"] = (
+            lambda ts, kind=kind: pub.send_telemetry(apply_spoof(scenario_wifi(wifi), kind), f"spoof:{kind}"))
+    return table
+
+
 def run(cfg):
     if cfg.seed:
         random.seed(cfg.seed)
@@ -970,91 +1158,66 @@ def run(cfg):
     last_health = 0.0
     last_status = 0.0
     last_step = time.time()
-    end_at = time.time() + cfg.duration_s if cfg.duration_s > 0 else None
+    end_at = last_step + cfg.duration_s if cfg.duration_s > 0 else None
 
     scenarios = cfg.scenarios
     if "all" in scenarios:
         scenarios = ALL_SCENARIOS
-
-    print(f"[run] scenarios={scenarios} rate={cfg.rate_hz}Hz "
+    send_health = "health" in scenarios
+    send_status = "status" in scenarios
+    table = scenario_table(pub, drones, multi_drones, aircraft)
+    handlers = []
+    for s in scenarios:
+        if s in ("health", "status"):
+            continue
+        if s not in table:
+            if s.startswith("spoof:"):
+                print(f"[warn] unknown spoof kind: {s.split(':', 1)[1]}", file=sys.stderr)
+            else:
+                print(f"[warn] unknown scenario: {s}", file=sys.stderr)
+            continue
+        handlers.append(table[s])
+    sims = [*drones.values(), *multi_drones]
+    burst = range(cfg.burst)
+    first_seen = drones["wifi"].first_seen
+
+    print(f"[run] scenarios={scenarios} rate={cfg.rate_hz}Hz burst={cfg.burst} "
           f"health={cfg.health_rate_hz}Hz status={cfg.status_rate_hz}Hz")
 
+    next_tick = time.monotonic()
     try:
         while True:
             now = time.time()
             dt = now - last_step
             last_step = now
-            for d in drones.values():
-                d.step(dt)
-            for d in multi_drones:
+            for d in sims:
                 d.step(dt)
             aircraft.step(dt)
+            cot_ts = cot_times()
 
-            for s in scenarios:
-                if s == "wifi":
-                    pub.send_telemetry(scenario_wifi(drones["wifi"]), "wifi")
-                elif s == "ble":
-                    pub.send_telemetry(scenario_ble(drones["ble"]), "ble")
-                elif s == "uart":
-                    pub.send_telemetry(scenario_uart(drones["uart"]), "uart")
-                elif s == "dji":
-                    pub.send_telemetry(scenario_dji(drones["dji"]), "dji")
-                elif s == "area":
-                    pub.send_telemetry(scenario_area(drones["wifi"]), "area")
-                elif s == "auth":
-                    for f in scenario_auth(drones["wifi"]):
-                        pub.send_telemetry(f, "auth")
-                elif s == "caa":
-                    pub.send_telemetry(scenario_caa(drones["wifi"]), "caa")
-                elif s == "utm":
-                    pub.send_telemetry(scenario_utm(drones["wifi"]), "utm")
-                elif s == "session":
-                    pub.send_telemetry(scenario_session(drones["wifi"]), "session")
-                elif s == "multi":
-                    pub.send_telemetry(scenario_multi(multi_drones), "multi")
-                elif s == "fpv":
-                    pub.send_telemetry(scenario_fpv(drones["wifi"]), "fpv")
-                elif s == "fpv_serial":
-                    pub.send_telemetry(scenario_fpv_serial(drones["wifi"]), "fpv_serial")
-                elif s == "legacy":
-                    pub.send_telemetry(scenario_legacy(drones["wifi"]), "legacy")
-                elif s.startswith("spoof:"):
-                    kind = s.split(":", 1)[1]
-                    if kind not in SPOOF_KINDS:
-                        print(f"[warn] unknown spoof kind: {kind}", file=sys.stderr)
-                        continue
-                    obj = apply_spoof(scenario_wifi(drones["wifi"]), kind)
-                    pub.send_telemetry(obj, f"spoof:{kind}")
-                elif s == "cot":
-                    pub.send_cot(cot_drone(drones["wifi"]), "cot_drone")
-                elif s == "pilot":
-                    pub.send_cot(cot_pilot(drones["wifi"]), "cot_pilot")
-                elif s == "home":
-                    pub.send_cot(cot_home(drones["wifi"]), "cot_home")
-                elif s == "adsb":
-                    pub.send_cot(cot_adsb(aircraft.as_dict()), "cot_adsb")
-                elif s == "status_cot":
-                    pub.send_cot(cot_status(), "status_cot")
-                elif s == "mqtt_dict":
-                    payload = mqtt_dict(drones["wifi"])
-                    pub.send_mqtt(payload, sub_topic=f"drone-{drones['wifi'].id}")
-                elif s in ("health", "status"):
-                    pass
-                else:
-                    print(f"[warn] unknown scenario: {s}", file=sys.stderr)
-
-            if "health" in scenarios and (now - last_health) >= health_period:
-                pub.send_health(scenario_health(int(now - drones["wifi"].first_seen)))
+            for handler in handlers:
+                for _ in burst:
+                    handler(cot_ts)
+
+            if send_health and (now - last_health) >= health_period:
+                pub.send_health(scenario_health(int(now - first_seen)))
                 last_health = now
 
-            if "status" in scenarios and (now - last_status) >= status_period:
+            if send_status and (now - last_status) >= status_period:
                 pub.send_status_json(scenario_status_json())
                 last_status = now
 
             if end_at is not None and now >= end_at:
                 break
 
-            time.sleep(period)
+            # Pace against a fixed schedule so send work doesn't stretch the
+            # period; after a stall, resync rather than firing a catch-up burst.
+            next_tick += period
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.monotonic()
     except KeyboardInterrupt:
         print("\n[run] interrupt — shutting down")
     finally:
@@ -1082,12 +1245,16 @@ def parse_args():
                    help=f"repeatable. One of: {', '.join(ALL_SCENARIOS)}, all, "
                         f"or spoof:{{{ '|'.join(SPOOF_KINDS) }}}. Default: wifi")
     p.add_argument("--rate", type=float, default=1.0, help="telemetry frames/sec (default 1)")
+    p.add_argument("--burst", type=int, default=1,
+                   help="send each scenario N times back-to-back per tick (default 1)")
     p.add_argument("--health-rate", type=float, default=0.1,
                    help="health snapshots/sec (default 0.1 = every 10s)")
     p.add_argument("--status-rate", type=float, default=0.033,
                    help="status frames/sec (default ~30s)")
     p.add_argument("--duration", type=float, default=0.0, help="seconds to run (0 = forever)")
     p.add_argument("--seed", type=int, default=0, help="RNG seed (0 = nondeterministic)")
+    p.add_argument("--log-every", type=int, default=1,
+                   help="print one [tx] line per N sends (default 1 = every send)")
     p.add_argument("--lat", type=float, default=37.25)
     p.add_argument("--lon", type=float, default=-115.75)
     return p.parse_args()
@@ -1105,10 +1272,12 @@ def main():
         mqtt_port=args.mqtt_port,
         mqtt_topic=args.mqtt_topic,
         rate_hz=args.rate,
+        burst=max(1, args.burst),
         health_rate_hz=args.health_rate,
         status_rate_hz=args.status_rate,
         duration_s=args.duration,
         seed=args.seed,
+        log_every=args.log_every,
         lat_center=args.lat,
         lon_center=args.lon,
         scenarios=args.scenario or ["wifi"],